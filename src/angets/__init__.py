@@ -16,9 +16,17 @@ __all__: list[str] = [
     "get_constrained_int",
     "get_positive_int",
     "get_non_negative_int",
+    "get_quantity",
+    "get_duration",
+    "get_size",
     "get_confirmation",
     "get_date",
+    "get_selection",
     "decorators",
+    "policies",
+    "units",
+    "parsers",
+    "config",
     "helpers",
     "exceptions"
 ]
@@ -35,9 +43,17 @@ from ._core import (
     get_constrained_int,
     get_positive_int,
     get_non_negative_int,
+    get_quantity,
+    get_duration,
+    get_size,
     get_confirmation,
     get_date,
+    get_selection,
 )
 from . import _decorators as decorators
+from . import _policies as policies
+from . import _units as units
+from . import _parsers as parsers
+from . import _config as config
 from . import _helpers as helpers
 from . import _exceptions as exceptions
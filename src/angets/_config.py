@@ -0,0 +1,392 @@
+"""Config - Validated views over settings from environment variables and config files."""
+
+# Built-ins
+from typing import Any, Callable, Iterator, Mapping, Optional
+from configparser import ConfigParser
+from functools import partial
+from inspect import signature
+from math import inf
+from os import PathLike
+from pathlib import Path
+import json
+import tomllib
+
+# Angets
+from ._core import (
+    get_non_empty_str,
+    get_constrained_number,
+    get_float,
+    get_constrained_float,
+    get_positive_float,
+    get_non_negative_float,
+    get_int,
+    get_constrained_int,
+    get_positive_int,
+    get_non_negative_int,
+    get_quantity,
+    get_duration,
+    get_size,
+    get_confirmation,
+    get_date,
+    get_selection,
+)
+from ._decorators import is_looped
+from ._helpers import mask_to_array
+from ._units import DURATION, SIZE, UnitTable
+from ._parsers import (
+    check_interval,
+    check_item_count,
+    constrain,
+    parse_confirmation,
+    parse_date,
+    parse_float,
+    parse_int,
+    parse_non_empty_str,
+    parse_selection,
+)
+from ._exceptions import InvalidConfigError, InvalidSettingError
+
+Rule = Callable[[str], Any]
+"""A function that validates a raw setting string and returns its value."""
+
+
+def _plain(parse: Callable[[str, Optional[str]], Any]) -> Callable[[dict], Rule]:
+    """Return a compiler for getters whose rule is the parser alone."""
+
+    def compile_arguments(arguments: dict) -> Rule:
+        warning: Optional[str] = arguments["warning"]
+        return lambda text: parse(text, warning)
+
+    return compile_arguments
+
+
+def _bounded(
+    parse: Callable[[str, Optional[str]], float | int],
+    within: Optional[tuple[float, float]] = None,
+    interval: Optional[str] = None,
+) -> Callable[[dict], Rule]:
+    """Return a compiler for getters bounding the parsed number, with fixed or bound constraints."""
+
+    def compile_arguments(arguments: dict) -> Rule:
+        warning: Optional[str] = arguments["warning"]
+        bounds: tuple[float, float] = within or arguments["within"]
+        limits: str = interval or arguments["interval"]
+        check_interval(limits)
+        return lambda text: constrain(parse(text, warning), bounds, limits, warning)
+
+    return compile_arguments
+
+
+def _quantity(units: Optional[UnitTable] = None) -> Callable[[dict], Rule]:
+    """Return a compiler for quantity getters, with fixed or bound units."""
+
+    def compile_arguments(arguments: dict) -> Rule:
+        table: UnitTable = units or arguments["units"]
+        warning: Optional[str] = arguments["warning"]
+        default_unit: Optional[str] = arguments["default_unit"]
+        bounds: tuple[float, float] = table.bounds(arguments["within"])
+        limits: str = arguments["interval"]
+        check_interval(limits)
+        return lambda text: constrain(
+            table.parse(text, default_unit, warning), bounds, limits, warning
+        )
+
+    return compile_arguments
+
+
+def _confirmation(arguments: dict) -> Rule:
+    """Return the rule for get_confirmation."""
+    warning: Optional[str] = arguments["warning"]
+    selection: Optional[dict[str, bool]] = arguments["selection"]
+    return lambda text: parse_confirmation(text, warning, selection)
+
+
+def _selection(arguments: dict) -> Rule:
+    """Return the rule for get_selection."""
+    warning: Optional[str] = arguments["warning"]
+    n_items: int = arguments["n_items"]
+    check_item_count(n_items)
+    if arguments["as_array"]:
+        return lambda text: mask_to_array(parse_selection(text, n_items, warning), n_items)
+
+    return lambda text: parse_selection(text, n_items, warning)
+
+
+def _constrained_number(arguments: dict) -> Rule:
+    """Return the rule for get_constrained_number, bounding the rule of its get_number getter."""
+    get_number: Callable = arguments["get_number"]
+    function: Callable = get_number.func if isinstance(get_number, partial) else get_number
+    if function not in _COMPILERS:
+        raise TypeError(f"No config rule for get_number: {get_number!r}")
+
+    warning: Optional[str] = arguments["warning"]
+    parse: Rule = compile_rule(partial(get_number, warning=warning))
+    bounds: tuple[float, float] = arguments["within"]
+    limits: str = arguments["interval"]
+    check_interval(limits)
+    return lambda text: constrain(parse(text), bounds, limits, warning)
+
+
+_COMPILERS: dict[Callable, Callable[[dict], Rule]] = {
+    get_non_empty_str: _plain(parse_non_empty_str),
+    get_constrained_number: _constrained_number,
+    get_float: _plain(parse_float),
+    get_constrained_float: _bounded(parse_float),
+    get_positive_float: _bounded(parse_float, (0, inf), "()"),
+    get_non_negative_float: _bounded(parse_float, (0, inf), "[)"),
+    get_int: _plain(parse_int),
+    get_constrained_int: _bounded(parse_int),
+    get_positive_int: _bounded(parse_int, (0, inf), "()"),
+    get_non_negative_int: _bounded(parse_int, (0, inf), "[)"),
+    get_quantity: _quantity(),
+    get_duration: _quantity(DURATION),
+    get_size: _quantity(SIZE),
+    get_date: _plain(parse_date),
+    get_confirmation: _confirmation,
+    get_selection: _selection,
+}
+"""Getters and the compilers turning their arguments into rules for raw strings."""
+
+
+def compile_rule(rule: Callable) -> Rule:
+    """Return a rule validating raw strings the same way as the given getter.
+
+    | Getters may be given with their arguments bound by functools.partial:
+    | >>> compile_rule(partial(get_constrained_int, (1, 65535), "[]"))
+    |
+    | Any other plain function is returned as is and is called with the raw string.
+    | Other looped functions prompt for input, so they cannot be used as rules.
+
+    :raise TypeError: If the bound arguments do not match the getter, or the rule is a looped function without a config rule.
+    :raise InvalidIntervalError: If the bound interval value is invalid.
+    """
+    function: Callable = rule
+    args: tuple = ()
+    keywords: dict[str, Any] = {}
+    if isinstance(rule, partial):
+        function, args, keywords = rule.func, rule.args, rule.keywords
+
+    compiler: Optional[Callable[[dict], Rule]] = _COMPILERS.get(function)
+    if compiler is None:
+        if is_looped(function):
+            raise TypeError(f"No config rule for looped function: {function!r}")
+
+        return rule
+
+    bound = signature(function).bind(*args, **keywords)
+    bound.apply_defaults()
+    return compiler(bound.arguments)
+
+
+class Config(Mapping[str, Any]):
+    """A read-only view validating each setting on first access.
+
+    | Rules are compiled once on creation, and every validated value is memoized.
+    | Missing settings without a default raise a KeyError, as with any other mapping.
+    """
+
+    def __init__(
+        self,
+        source: Mapping[str, str],
+        schema: Mapping[str, Callable],
+        defaults: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Create and return a new Config object.
+
+        :param dict source: The raw settings, such as os.environ.
+        :param dict schema: The getter or rule for each setting. See compile_rule.
+        :param dict defaults: Values for settings missing from the source. Defaults are not validated.
+        """
+        self._source: Mapping[str, str] = source
+        self._rules: dict[str, Rule] = {
+            key: compile_rule(rule) for key, rule in schema.items()
+        }
+        self._defaults: dict[str, Any] = dict(defaults or {})
+        self._values: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the validated setting.
+
+        :raise KeyError: If the setting is not in the schema, or is missing without a default.
+        :raise InvalidSettingError: If the setting is invalid.
+        """
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        rule: Rule = self._rules[key]
+        try:
+            text: str = self._source[key]
+        except KeyError:
+            if key in self._defaults:
+                return self._defaults[key]
+
+            raise
+
+        try:
+            value: Any = rule(text)
+        except ValueError as error:
+            raise InvalidSettingError(key, str(error)) from error
+
+        self._values[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rules and (key in self._source or key in self._defaults)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self._rules if key in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def validate(self) -> "Config":
+        """Validate every setting not validated yet in one pass.
+
+        :return: The config itself.
+        :raise InvalidConfigError: With every invalid or missing setting, if there are any.
+        """
+        errors: list[InvalidSettingError] = []
+        for key in self._rules:
+            if key in self._values:
+                continue
+
+            try:
+                self[key]
+            except KeyError:
+                errors.append(InvalidSettingError(key, None))
+            except InvalidSettingError as error:
+                errors.append(error)
+
+        if errors:
+            raise InvalidConfigError(errors)
+
+        return self
+
+
+def from_mapping(
+    source: Mapping[str, str],
+    schema: Mapping[str, Callable],
+    defaults: Optional[Mapping[str, Any]] = None,
+    lazy: bool = True,
+) -> Config:
+    """Return a validated view over a mapping of raw settings, such as os.environ.
+
+    | >>> settings = from_mapping(os.environ, {"PORT": get_positive_int, "DEBUG": get_confirmation})
+    | >>> settings["PORT"]
+    | 8080
+
+    :param dict source: The raw settings. The mapping is read on access, not copied.
+    :param dict schema: The getter or rule for each setting. See compile_rule.
+    :param dict defaults: Values for settings missing from the source. Defaults are not validated.
+    :param bool lazy: Validate each setting on first access. If False, every setting is validated at once.
+
+    :raise InvalidConfigError: If lazy is False and any setting is invalid or missing.
+    """
+    config: Config = Config(source, schema, defaults)
+    return config if lazy else config.validate()
+
+
+def _stringify(value: Any) -> str:
+    """Return a value loaded from a file as a raw setting string."""
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+
+    return str(value)
+
+
+def _flatten(data: Mapping[str, Any], prefix: str = "") -> dict[str, str]:
+    """Return nested tables as raw setting strings with dotted keys."""
+    flat: dict[str, str] = {}
+    for key, value in data.items():
+        if isinstance(value, Mapping):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = _stringify(value)
+
+    return flat
+
+
+def _load_json(path: Path) -> dict[str, str]:
+    """Return the raw settings in a JSON file."""
+    with path.open(encoding="utf-8") as file:
+        return _flatten(json.load(file))
+
+
+def _load_toml(path: Path) -> dict[str, str]:
+    """Return the raw settings in a TOML file."""
+    with path.open("rb") as file:
+        return _flatten(tomllib.load(file))
+
+
+def _load_ini(path: Path) -> dict[str, str]:
+    """Return the raw settings in an INI file."""
+    parser: ConfigParser = ConfigParser(interpolation=None)
+    # Keep the keys case-sensitive.
+    parser.optionxform = str  # type: ignore[assignment, method-assign]
+    with path.open(encoding="utf-8") as file:
+        parser.read_file(file)
+
+    flat: dict[str, str] = dict(parser.defaults())
+    for section in parser.sections():
+        for key, value in parser.items(section):
+            flat[f"{section}.{key}"] = value
+
+    return flat
+
+
+def _load_env(path: Path) -> dict[str, str]:
+    """Return the raw settings in a .env file."""
+    flat: dict[str, str] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+
+        key, value = line.removeprefix("export ").split("=", 1)
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+
+        flat[key.strip()] = value
+
+    return flat
+
+
+_LOADERS: dict[str, Callable[[Path], dict[str, str]]] = {
+    ".json": _load_json,
+    ".toml": _load_toml,
+    ".ini": _load_ini,
+    ".cfg": _load_ini,
+    ".env": _load_env,
+}
+"""File suffixes and their loaders."""
+
+
+def from_file(
+    path: str | PathLike,
+    schema: Mapping[str, Callable],
+    defaults: Optional[Mapping[str, Any]] = None,
+    lazy: bool = True,
+) -> Config:
+    """Return a validated view over the settings in a JSON, TOML, INI or .env file.
+
+    | Nested tables and INI sections are flattened into dotted keys, such as 'server.port'.
+    | Values that are not strings are converted to strings first, booleans to 'yes' or 'no'.
+
+    :param path: The config file. The format is chosen by the file suffix.
+    :param dict schema: The getter or rule for each setting. See compile_rule.
+    :param dict defaults: Values for settings missing from the file. Defaults are not validated.
+    :param bool lazy: Validate each setting on first access. If False, every setting is validated at once.
+
+    :raise ValueError: If the file format is not supported.
+    :raise InvalidConfigError: If lazy is False and any setting is invalid or missing.
+    """
+    path = Path(path)
+    name: str = path.name if path.name == ".env" else path.suffix
+    loader: Optional[Callable[[Path], dict[str, str]]] = _LOADERS.get(name.lower())
+    if loader is None:
+        raise ValueError(f"Unsupported config file format: {path.name}")
+
+    return from_mapping(loader(path), schema, defaults, lazy)
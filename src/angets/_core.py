@@ -1,23 +1,34 @@
 """Core - Implementation details."""
 
 # Built-ins
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from datetime import date
 from math import inf
 
 # Angets
 from ._decorators import loop
-from ._helpers import convert_float_to_int, normalize_to_ascii
+from ._helpers import mask_to_array
+from ._units import DURATION, SIZE, UnitTable
+from ._parsers import (
+    check_interval,
+    check_item_count,
+    constrain,
+    parse_confirmation,
+    parse_date,
+    parse_float,
+    parse_int,
+    parse_non_empty_str,
+    parse_selection,
+)
 from ._exceptions import (
-    EmptyStringError,
-    InvalidConfirmationError,
     InvalidISOFormatError,
-    InvalidIntervalError,
-    OutOfBoundsError,
     NonFloatingPointError,
     NonIntegerError,
 )
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
 
 @loop
 def get_non_empty_str(
@@ -31,16 +42,13 @@ def get_non_empty_str(
 
     :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
     :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
 
     :return: A non-empty string.
 
     :raise EmptyStringError: If the input string is empty.
     """
-    user_input: str = input(prompt)
-    if not user_input.isspace() and len(user_input) != 0:
-        return user_input
-    else:
-        raise EmptyStringError(warning)
+    return parse_non_empty_str(input(prompt), warning)
 
 
 @loop
@@ -62,26 +70,14 @@ def get_constrained_number(
 
     :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
     :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
 
     :return: A number within bounds.
 
     :raise InvalidIntervalError: If the interval value is invalid.
     """
-    intervals: list[str] = ["()", "[]", "(]", "[)"]
-    if interval not in intervals:
-        raise InvalidIntervalError(intervals, interval)
-
-    user_input: float | int = get_number(prompt, warning)
-    is_within_lower_bound: bool = (
-        within[0] < user_input if interval[0] == "(" else within[0] <= user_input
-    )
-    is_within_upper_bound: bool = (
-        within[1] > user_input if interval[1] == ")" else within[1] >= user_input
-    )
-    if is_within_lower_bound and is_within_upper_bound:
-        return user_input
-    else:
-        raise OutOfBoundsError(warning)
+    check_interval(interval)
+    return constrain(get_number(prompt, warning), within, interval, warning)
 
 
 @loop
@@ -94,9 +90,10 @@ def get_float(prompt: str = "", warning: Optional[str] = None, **kwargs: Any) ->
 
     :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
     :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
     """
     try:
-        return float(normalize_to_ascii(get_non_empty_str(prompt)))
+        return parse_float(get_non_empty_str(prompt))
     except ValueError:
         raise NonFloatingPointError(warning)
 
@@ -119,10 +116,9 @@ def get_constrained_float(
 
     :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
     :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
     """
-    return get_constrained_number(
-        get_float, within, interval, prompt, warning, **kwargs
-    )
+    return get_constrained_number(get_float, within, interval, prompt, warning)
 
 
 @loop
@@ -137,8 +133,9 @@ def get_positive_float(
 
     :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
     :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
     """
-    return get_constrained_float((0, inf), "()", prompt, warning, **kwargs)
+    return get_constrained_float((0, inf), "()", prompt, warning)
 
 
 @loop
@@ -153,8 +150,9 @@ def get_non_negative_float(
 
     :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
     :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
     """
-    return get_constrained_float((0, inf), "[)", prompt, warning, **kwargs)
+    return get_constrained_float((0, inf), "[)", prompt, warning)
 
 
 @loop
@@ -167,9 +165,10 @@ def get_int(prompt: str = "", warning: Optional[str] = None, **kwargs: Any) -> i
 
     :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
     :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
     """
     try:
-        return convert_float_to_int(get_float(prompt))
+        return parse_int(get_non_empty_str(prompt))
     except ValueError:
         raise NonIntegerError(warning)
 
@@ -192,8 +191,9 @@ def get_constrained_int(
 
     :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
     :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
     """
-    return get_constrained_number(get_int, within, interval, prompt, warning, **kwargs)
+    return get_constrained_number(get_int, within, interval, prompt, warning)
 
 
 @loop
@@ -208,8 +208,9 @@ def get_positive_int(
 
     :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
     :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
     """
-    return get_constrained_int((0, inf), "()", prompt, warning, **kwargs)
+    return get_constrained_int((0, inf), "()", prompt, warning)
 
 
 @loop
@@ -224,8 +225,127 @@ def get_non_negative_int(
 
     :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
     :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
+    """
+    return get_constrained_int((0, inf), "[)", prompt, warning)
+
+
+def get_quantity(
+    units: UnitTable,
+    within: tuple[float | str, float | str],
+    interval: str,
+    prompt: str = "",
+    warning: Optional[str] = None,
+    default_unit: Optional[str] = None,
+    **kwargs: Any,
+) -> float:
+    """Prompts for a quantity with a unit, such as '2.5km', within the constraints.
+
+    :param UnitTable units: The units the input may be given in.
+    :param tuple within: A tuple representing (lower, upper) in which the input quantity must lie within. Strings are read with units, numbers are in base units.
+    :param str interval: '(' or ')' for non-inclusive, '[' or ']' for inclusive.
+    :param str prompt: The prompt string.
+    :param str warning: User defined warning string. If None, the default warning will be used.
+    :param str default_unit: The unit for inputs without one. If None, the base unit of the table will be used.
+    :param kwargs: Keyword arguments for the looping logic.
+
+    :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
+    :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
+
+    :return: The quantity in base units.
+
+    :raise InvalidBoundsError: If a bound cannot be read with the units.
+    :raise InvalidIntervalError: If the interval value is invalid.
+    """
+    # Checked once before prompting, as they are not the user's to fix.
+    check_interval(interval)
+    bounds: tuple[float, float] = units.bounds(within)
+    return _get_quantity(
+        units, bounds, interval, prompt, warning, default_unit, **kwargs
+    )
+
+
+@loop
+def _get_quantity(
+    units: UnitTable,
+    bounds: tuple[float, float],
+    interval: str,
+    prompt: str,
+    warning: Optional[str],
+    default_unit: Optional[str],
+    **kwargs: Any,
+) -> float:
+    """Prompts for a quantity with a unit within bounds already in base units."""
+    return get_constrained_number(
+        lambda prompt, warning: units.parse(
+            get_non_empty_str(prompt), default_unit, warning
+        ),
+        bounds,
+        interval,
+        prompt,
+        warning,
+    )
+
+
+def get_duration(
+    prompt: str = "",
+    warning: Optional[str] = None,
+    within: tuple[float | str, float | str] = (0, inf),
+    interval: str = "[)",
+    default_unit: Optional[str] = None,
+    **kwargs: Any,
+) -> float:
+    """Prompts for a non-negative duration, such as '250ms' or '30m'.
+
+    :param str prompt: The prompt string.
+    :param str warning: User defined warning string. If None, the default warning will be used.
+    :param tuple within: A tuple representing (lower, upper) in which the input duration must lie within. Strings are read with units, numbers are in seconds.
+    :param str interval: '(' or ')' for non-inclusive, '[' or ']' for inclusive.
+    :param str default_unit: The unit for inputs without one. Seconds by default.
+    :param kwargs: Keyword arguments for the looping logic.
+
+    :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
+    :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
+
+    :return: The duration in seconds.
+
+    :raise InvalidBoundsError: If a bound cannot be read with the units.
+    """
+    return get_quantity(
+        DURATION, within, interval, prompt, warning, default_unit, **kwargs
+    )
+
+
+def get_size(
+    prompt: str = "",
+    warning: Optional[str] = None,
+    within: tuple[float | str, float | str] = (0, inf),
+    interval: str = "[)",
+    default_unit: Optional[str] = None,
+    **kwargs: Any,
+) -> float:
+    """Prompts for a non-negative data size, such as '1.5 GiB' or '500kB'.
+
+    :param str prompt: The prompt string.
+    :param str warning: User defined warning string. If None, the default warning will be used.
+    :param tuple within: A tuple representing (lower, upper) in which the input size must lie within. Strings are read with units, numbers are in bytes.
+    :param str interval: '(' or ')' for non-inclusive, '[' or ']' for inclusive.
+    :param str default_unit: The unit for inputs without one. Bytes by default.
+    :param kwargs: Keyword arguments for the looping logic.
+
+    :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
+    :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
+
+    :return: The size in bytes.
+
+    :raise InvalidBoundsError: If a bound cannot be read with the units.
     """
-    return get_constrained_int((0, inf), "[)", prompt, warning, **kwargs)
+    return get_quantity(
+        SIZE, within, interval, prompt, warning, default_unit, **kwargs
+    )
 
 
 @loop
@@ -238,12 +358,12 @@ def get_date(prompt: str = "", warning: Optional[str] = None, **kwargs: Any) ->
 
     :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
     :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
 
     :return: A date object.
     """
     try:
-        user_input: str = normalize_to_ascii(get_non_empty_str(prompt))
-        return date.fromisoformat(user_input)
+        return parse_date(get_non_empty_str(prompt))
     except ValueError:
         raise InvalidISOFormatError(warning)
 
@@ -264,13 +384,53 @@ def get_confirmation(
 
     :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
     :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
 
     :return: True if 'yes' or 'y', otherwise False.
     """
-    selection = selection or {"yes": True, "y": True, "no": False, "n": False}
-    # Make the selection keys case-insensitive.
-    selection = {key.lower(): value for key, value in selection.items()}
-    try:
-        return selection[get_non_empty_str(prompt).strip().lower()]
-    except KeyError:
-        raise InvalidConfirmationError(warning)
+    return parse_confirmation(get_non_empty_str(prompt), warning, selection)
+
+
+def get_selection(
+    n_items: int,
+    prompt: str = "",
+    warning: Optional[str] = None,
+    as_array: bool = False,
+    **kwargs: Any,
+) -> "int | NDArray":
+    """Prompts for a selection of items, such as '1-5,8,10-' or 'all,!3'.
+
+    | Items are numbered from 1 to n_items.
+    | 'N' selects an item, 'N-M' a range, 'N-' and '-M' open ranges, 'all' and 'none' every or no item.
+    | A term prefixed with '!' is deselected. If the first term is deselected, every item is selected before it.
+
+    :param int n_items: The number of items to select from.
+    :param str prompt: The prompt string.
+    :param str warning: User defined warning string. If None, the default warning will be used.
+    :param bool as_array: Return a NumPy bool array of length n_items instead of a bitmask. Requires NumPy.
+    :param kwargs: Keyword arguments for the looping logic.
+
+    :key bool verbose: Warn the user if any exceptions are raised. No warning will be printed unless explicitly set to True.
+    :key int attempts: Allowed number of attempts before raising an exception. One by default.
+    :key RetryPolicy policy: Precomputed retry policy. Takes precedence over verbose and attempts.
+
+    :return: A bitmask where bit 0 is item 1, or a NumPy bool array where index 0 is item 1.
+
+    :raise InvalidItemCountError: If the number of items is invalid.
+    """
+    # Checked once before prompting, as it is not the user's to fix.
+    check_item_count(n_items)
+    return _get_selection(n_items, prompt, warning, as_array, **kwargs)
+
+
+@loop
+def _get_selection(
+    n_items: int,
+    prompt: str,
+    warning: Optional[str],
+    as_array: bool,
+    **kwargs: Any,
+) -> "int | NDArray":
+    """Prompts for a selection of items from an already checked number of items."""
+    mask: int = parse_selection(get_non_empty_str(prompt), n_items, warning)
+    return mask_to_array(mask, n_items) if as_array else mask
@@ -5,9 +5,15 @@ from typing import Callable
 from functools import wraps
 
 # Angets
-from ._defaults import ATTEMPTS
-from ._helpers import warn
-from ._exceptions import AttemptsExceededError, InvalidAttemptsValueError
+from ._policies import Budget, RetryPolicy, _looping, _shared_budget, resolve_policy
+
+LOOPED: str = "__angets_looped__"
+"""Attribute set on every function wrapped by loop."""
+
+
+def is_looped(function: Callable) -> bool:
+    """Return True if the function was wrapped by loop."""
+    return getattr(function, LOOPED, False) is True
 
 
 def loop(function: Callable):
@@ -22,6 +28,12 @@ def loop(function: Callable):
     | Possible key word arguments for the functions to be wrapped:
     | attempts - Number of attempts to be made before an exception is raised.
     | verbose - Whether to print the warning message to the console or not.
+    | policy - A RetryPolicy to use instead of attempts and verbose.
+    |
+    | Only the outermost retrying call retries.
+    | Looped functions called from within it run once and leave their failures to the outer loop.
+    | Calls with a single attempt do not retry, so looped functions called from within them keep their own attempts.
+    | Within a policies.budget() context, the outermost call draws its attempts from the shared budget.
 
     :param function: The function to wrap.
     :return: The wrapped function.
@@ -30,20 +42,27 @@ def loop(function: Callable):
     """
     @wraps(function)
     def wrapper(*args, **kwargs):
-        attempts: int = kwargs.get("attempts", ATTEMPTS)
-        if attempts <= 0:
-            raise InvalidAttemptsValueError(attempts)
-        elif attempts == 1:
+        if _looping.get():
             return function(*args, **kwargs)
-        else:
-            for _ in range(attempts):
+
+        budget: Budget | None = _shared_budget.get()
+        if budget is None:
+            policy: RetryPolicy = resolve_policy(kwargs)
+            if policy.attempts == 1:
+                return function(*args, **kwargs)
+
+            budget = Budget(policy)
+
+        token = _looping.set(True)
+        try:
+            while True:
+                budget.take()
                 try:
                     return function(*args, **kwargs)
                 except ValueError as error:
-                    if kwargs.get("verbose"):
-                        warn(str(error))
-                    continue
-            else:
-                raise AttemptsExceededError(attempts)
+                    budget.spend(error)
+        finally:
+            _looping.reset(token)
 
+    setattr(wrapper, LOOPED, True)
     return wrapper
@@ -2,3 +2,9 @@
 
 ATTEMPTS: int = 1
 """Allowed number of attempts before raising an AttemptsExceededError exception."""
+
+INTERVALS: tuple[str, ...] = ("()", "[]", "(]", "[)")
+"""Valid intervals. '(' or ')' for non-inclusive, '[' or ']' for inclusive."""
+
+SELECTION: dict[str, bool] = {"yes": True, "y": True, "no": False, "n": False}
+"""Default confirmation selection options."""
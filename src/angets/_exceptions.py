@@ -56,6 +56,14 @@ class InvalidIntervalError(Exception):
         )
 
 
+class InvalidBoundsError(Exception):
+    """Invalid bounds."""
+
+    def __init__(self, within: tuple) -> None:
+        """Create and return a new InvalidBoundsError object."""
+        super(InvalidBoundsError, self).__init__(f"Invalid bounds: {within}")
+
+
 class OutOfBoundsError(ValueError):
     """Value not within bounds."""
 
@@ -98,3 +106,58 @@ class NonIntegerError(ValueError):
             warning = "Not an integer. Please input a valid integer number."
 
         super(NonIntegerError, self).__init__(warning)
+
+
+class InvalidUnitError(ValueError):
+    """Unknown unit."""
+
+    def __init__(self, warning: Optional[str]) -> None:
+        """Create and return a new InvalidUnitError object."""
+        if warning is None:
+            warning = "Unknown unit. Please input a number followed by a valid unit."
+
+        super(InvalidUnitError, self).__init__(warning)
+
+
+class InvalidSettingError(ValueError):
+    """Invalid or missing configuration setting."""
+
+    def __init__(self, key: str, warning: Optional[str]) -> None:
+        """Create and return a new InvalidSettingError object."""
+        if warning is None:
+            warning = "Missing setting."
+
+        self.key: str = key
+        super(InvalidSettingError, self).__init__(f"{key}: {warning}")
+
+
+class InvalidConfigError(ValueError):
+    """One or more invalid configuration settings."""
+
+    def __init__(self, errors: list[InvalidSettingError]) -> None:
+        """Create and return a new InvalidConfigError object."""
+        self.errors: list[InvalidSettingError] = errors
+        super(InvalidConfigError, self).__init__(
+            "Invalid configuration:\n" + "\n".join(str(error) for error in errors)
+        )
+
+
+class InvalidItemCountError(Exception):
+    """Invalid number of items to select from."""
+
+    def __init__(self, n_items: int) -> None:
+        """Create and return a new InvalidItemCountError object."""
+        super(InvalidItemCountError, self).__init__(
+            f"{n_items} is not a valid number of items."
+        )
+
+
+class InvalidSelectionError(ValueError):
+    """Invalid selection expression."""
+
+    def __init__(self, warning: Optional[str]) -> None:
+        """Create and return a new InvalidSelectionError object."""
+        if warning is None:
+            warning = "Invalid selection. Example: (1-5,8,10-,!9)"
+
+        super(InvalidSelectionError, self).__init__(warning)
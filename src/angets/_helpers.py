@@ -1,12 +1,16 @@
 """Utility functions for Angets."""
 
 # Built-ins
+from typing import TYPE_CHECKING, Any
 from unicodedata import normalize
 from re import sub
 
 # Angets
 from ._exceptions import NonIntegerError
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
 
 def warn(warning: str) -> None:
     """Prints the warning message the stream, if there is one."""
@@ -28,3 +32,25 @@ def convert_float_to_int(float_number: float, warning: str | None = None) -> int
 def normalize_to_ascii(non_ascii_string: str) -> str:
     """Convert a Japanese full-width number to half-width."""
     return sub("[ー－―—‐]", "-", normalize("NFKC", non_ascii_string))
+
+
+def import_numpy() -> Any:
+    """Return the NumPy module for the features that require it.
+
+    :raise ModuleNotFoundError: If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ModuleNotFoundError as error:
+        raise ModuleNotFoundError(
+            "NumPy is required for this feature. Install it with: pip install angets[numpy]"
+        ) from error
+
+    return numpy
+
+
+def mask_to_array(mask: int, length: int) -> "NDArray":
+    """Return the lowest bits of an integer bitmask as a NumPy bool array, least significant bit first."""
+    numpy = import_numpy()
+    packed = numpy.frombuffer(mask.to_bytes((length + 7) // 8, "little"), dtype=numpy.uint8)
+    return numpy.unpackbits(packed, count=length, bitorder="little").astype(bool)
@@ -0,0 +1,189 @@
+"""Parsers - Validation rules shared by the getters, applied to strings."""
+
+# Built-ins
+from typing import Optional
+from datetime import date
+
+# Angets
+from ._defaults import INTERVALS, SELECTION
+from ._helpers import convert_float_to_int, normalize_to_ascii
+from ._exceptions import (
+    EmptyStringError,
+    InvalidConfirmationError,
+    InvalidISOFormatError,
+    InvalidIntervalError,
+    InvalidItemCountError,
+    InvalidSelectionError,
+    OutOfBoundsError,
+    NonFloatingPointError,
+    NonIntegerError,
+)
+
+
+def parse_non_empty_str(text: str, warning: Optional[str] = None) -> str:
+    """Return the string if it is not empty.
+
+    :raise EmptyStringError: If the string is empty or whitespace.
+    """
+    if not text.isspace() and len(text) != 0:
+        return text
+    else:
+        raise EmptyStringError(warning)
+
+
+def check_interval(interval: str) -> None:
+    """Check that the interval is one of '()', '[]', '(]' or '[)'.
+
+    :raise InvalidIntervalError: If the interval value is invalid.
+    """
+    if interval not in INTERVALS:
+        raise InvalidIntervalError(list(INTERVALS), interval)
+
+
+def constrain(
+    number: float | int,
+    within: tuple[float, float],
+    interval: str,
+    warning: Optional[str] = None,
+) -> float | int:
+    """Return the number if it lies within the constraints.
+
+    :param tuple within: A tuple representing (lower, upper) in which the number must lie within.
+    :param str interval: '(' or ')' for non-inclusive, '[' or ']' for inclusive. Checked beforehand with check_interval.
+
+    :raise OutOfBoundsError: If the number is out of bounds.
+    """
+    is_within_lower_bound: bool = (
+        within[0] < number if interval[0] == "(" else within[0] <= number
+    )
+    is_within_upper_bound: bool = (
+        within[1] > number if interval[1] == ")" else within[1] >= number
+    )
+    if is_within_lower_bound and is_within_upper_bound:
+        return number
+    else:
+        raise OutOfBoundsError(warning)
+
+
+def parse_float(text: str, warning: Optional[str] = None) -> float:
+    """Return the string as a floating-point number. Full-width characters are normalized.
+
+    :raise NonFloatingPointError: If the string is not a floating-point number.
+    """
+    try:
+        return float(normalize_to_ascii(text))
+    except ValueError:
+        raise NonFloatingPointError(warning)
+
+
+def parse_int(text: str, warning: Optional[str] = None) -> int:
+    """Return the string as an integer. Floating-point numbers without a fractional part are accepted.
+
+    :raise NonIntegerError: If the string is not an integer.
+    """
+    try:
+        return convert_float_to_int(parse_float(text))
+    except ValueError:
+        raise NonIntegerError(warning)
+
+
+def parse_date(text: str, warning: Optional[str] = None) -> date:
+    """Return the string as a date. Full-width characters are normalized.
+
+    :raise InvalidISOFormatError: If the string is not in ISO 8601 format.
+    """
+    try:
+        return date.fromisoformat(normalize_to_ascii(text))
+    except ValueError:
+        raise InvalidISOFormatError(warning)
+
+
+def parse_confirmation(
+    text: str,
+    warning: Optional[str] = None,
+    selection: Optional[dict[str, bool]] = None,
+) -> bool:
+    """Return the confirmation value of the string. Case-insensitive.
+
+    :param dict selection: A dictionary of options to confirm with. If None, the default confirmation selection options will be used.
+
+    :raise InvalidConfirmationError: If the string is not one of the options.
+    """
+    if not selection:
+        selection = SELECTION
+    else:
+        # Make the selection keys case-insensitive.
+        selection = {key.lower(): value for key, value in selection.items()}
+
+    try:
+        return selection[text.strip().lower()]
+    except KeyError:
+        raise InvalidConfirmationError(warning)
+
+
+def check_item_count(n_items: int) -> None:
+    """Check that the number of items to select from is a non-negative integer.
+
+    :raise InvalidItemCountError: If the number of items is invalid.
+    """
+    if not isinstance(n_items, int) or n_items < 0:
+        raise InvalidItemCountError(n_items)
+
+
+def _parse_index(text: str, n_items: int, warning: Optional[str]) -> int:
+    """Return an item number between 1 and n_items."""
+    return int(constrain(parse_int(text.strip(), warning), (1, n_items), "[]", warning))
+
+
+def parse_selection(text: str, n_items: int, warning: Optional[str] = None) -> int:
+    """Return a selection expression such as '1-5,8,10-' as a bitmask, where bit 0 is item 1.
+
+    | Items are numbered from 1 to n_items. Terms are separated by commas and applied from left to right.
+    | 'N' selects an item, 'N-M' a range, 'N-' and '-M' open ranges, 'all' and 'none' every or no item.
+    | A term prefixed with '!' is deselected. If the first term is deselected, every item is selected before it.
+
+    :param int n_items: The number of items to select from. Checked beforehand with check_item_count.
+
+    :raise InvalidSelectionError: If a term is empty or malformed, or a range is reversed.
+    :raise NonIntegerError: If an item number is not an integer.
+    :raise OutOfBoundsError: If an item number is not between 1 and n_items.
+    """
+    every: int = (1 << n_items) - 1
+    mask: int = 0
+    is_first: bool = True
+    for term in normalize_to_ascii(text).lower().split(","):
+        term = term.strip()
+        if not term:
+            raise InvalidSelectionError(warning)
+
+        is_negated: bool = term[0] == "!"
+        if is_negated:
+            term = term[1:].strip()
+            if is_first:
+                mask = every
+
+        is_first = False
+        if term == "all":
+            bits: int = every
+        elif term == "none":
+            bits = 0
+        elif not term:
+            raise InvalidSelectionError(warning)
+        else:
+            start, dash, stop = term.partition("-")
+            if dash and ((not start.strip() and not stop.strip()) or "-" in stop):
+                raise InvalidSelectionError(warning)
+
+            lower: int = _parse_index(start, n_items, warning) if start.strip() else 1
+            upper: int = lower
+            if dash:
+                upper = _parse_index(stop, n_items, warning) if stop.strip() else n_items
+
+            if lower > upper:
+                raise InvalidSelectionError(warning)
+
+            bits = ((1 << (upper - lower + 1)) - 1) << (lower - 1)
+
+        mask = mask & ~bits if is_negated else mask | bits
+
+    return mask
@@ -0,0 +1,175 @@
+"""Retry policies for Angets."""
+
+# Built-ins
+from typing import Any, Iterator, Mapping, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from math import inf
+from time import sleep
+
+# Angets
+from ._defaults import ATTEMPTS
+from ._helpers import warn
+from ._exceptions import AttemptsExceededError, InvalidAttemptsValueError
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Precomputed retry settings for looped functions.
+
+    | A policy is validated once on creation and can then be reused for any number of calls:
+    | >>> policy = RetryPolicy(attempts=5, verbose=True, limits={NonIntegerError: 2})
+    | >>> function(..., policy=policy)
+
+    :param int attempts: Allowed number of attempts before raising an exception.
+    :param bool verbose: Warn the user if any exceptions are raised.
+    :param dict limits: Allowed number of attempts per exception type, checked with isinstance.
+    :param float backoff: Seconds to wait before the first retry. No waiting by default.
+    :param float backoff_factor: Multiplier applied to the wait time after every retry.
+    :param float max_backoff: Upper limit for the wait time between retries.
+
+    :raise InvalidAttemptsValueError: If any of the given number of attempts is invalid.
+    """
+
+    attempts: int = ATTEMPTS
+    verbose: bool = False
+    limits: Mapping[type[ValueError], int] = field(default_factory=dict, hash=False)
+    backoff: float = 0.0
+    backoff_factor: float = 2.0
+    max_backoff: float = inf
+    _limits: frozenset[tuple[type[ValueError], int]] = field(
+        init=False, repr=False, compare=False, hash=True
+    )
+
+    def __post_init__(self) -> None:
+        if self.attempts <= 0:
+            raise InvalidAttemptsValueError(self.attempts)
+
+        for limit in self.limits.values():
+            if limit <= 0:
+                raise InvalidAttemptsValueError(limit)
+
+        object.__setattr__(self, "_limits", frozenset(self.limits.items()))
+
+    def delay(self, retries: int) -> float:
+        """Return the wait time in seconds before the given retry (1-indexed)."""
+        if not self.backoff:
+            return 0.0
+
+        return min(self.backoff * self.backoff_factor ** (retries - 1), self.max_backoff)
+
+
+DEFAULT_POLICY: RetryPolicy = RetryPolicy()
+"""Policy used when neither a policy nor attempts are given."""
+
+
+@lru_cache(maxsize=64)
+def _policy_for(attempts: int, verbose: bool) -> RetryPolicy:
+    """Return a shared policy for the legacy attempts and verbose keyword arguments."""
+    return RetryPolicy(attempts, verbose)
+
+
+def resolve_policy(kwargs: Mapping[str, Any]) -> RetryPolicy:
+    """Return the retry policy described by the keyword arguments of a looped function.
+
+    | An explicit policy takes precedence over the attempts and verbose keyword arguments.
+
+    :raise InvalidAttemptsValueError: If the given number of attempts is invalid.
+    """
+    policy: Optional[RetryPolicy] = kwargs.get("policy")
+    if policy is not None:
+        return policy
+
+    attempts: int = kwargs.get("attempts", ATTEMPTS)
+    verbose: bool = bool(kwargs.get("verbose"))
+    if attempts == ATTEMPTS and not verbose:
+        return DEFAULT_POLICY
+
+    return _policy_for(attempts, verbose)
+
+
+class Budget:
+    """Attempts spent so far under a retry policy."""
+
+    __slots__ = ("policy", "used", "failed", "failures")
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        """Create and return a new Budget object."""
+        self.policy: RetryPolicy = policy
+        self.used: int = 0
+        self.failed: int = 0
+        self.failures: dict[type[ValueError], int] = {}
+
+    def take(self) -> None:
+        """Record the start of an attempt.
+
+        :raise AttemptsExceededError: If every attempt has already been used.
+        """
+        if self.used >= self.policy.attempts:
+            raise AttemptsExceededError(self.used)
+
+        self.used += 1
+
+    def spend(self, error: ValueError) -> None:
+        """Record a failed attempt and wait for the backoff, if there is one.
+
+        | As with a single attempt outside of a budget, a budget of one attempt re-raises the error itself.
+
+        :raise AttemptsExceededError: If the policy does not allow another attempt.
+        """
+        policy: RetryPolicy = self.policy
+        if policy.attempts == 1:
+            raise error
+
+        if policy.verbose:
+            warn(str(error))
+
+        self.failed += 1
+        if self.used >= policy.attempts:
+            raise AttemptsExceededError(self.used) from error
+
+        for kind, limit in policy._limits:
+            if isinstance(error, kind):
+                count: int = self.failures.get(kind, 0) + 1
+                self.failures[kind] = count
+                if count >= limit:
+                    raise AttemptsExceededError(self.used) from error
+
+        if policy.backoff:
+            sleep(policy.delay(self.failed))
+
+
+_shared_budget: ContextVar[Optional[Budget]] = ContextVar("_shared_budget", default=None)
+"""Budget opened with budget(), shared by every looped call in the context."""
+
+_looping: ContextVar[bool] = ContextVar("_looping", default=False)
+"""Whether a looped function is already running in the current context."""
+
+
+@contextmanager
+def budget(policy: RetryPolicy | int) -> Iterator[Budget]:
+    """Share one attempt budget across every looped call made within the context.
+
+    | >>> with budget(5):
+    | ...     name = get_non_empty_str("Name: ")
+    | ...     age = get_positive_int("Age: ")
+    |
+    | Both prompts draw from the same five attempts. Every attempt counts, successful or not.
+    | Once the budget is used up, further calls raise AttemptsExceededError without prompting.
+    | The attempts, verbose and policy keyword arguments of the calls are ignored within the context.
+
+    :param policy: A retry policy or the number of attempts to share.
+    :return: The shared budget.
+    :raise InvalidAttemptsValueError: If the given number of attempts is invalid.
+    """
+    if not isinstance(policy, RetryPolicy):
+        policy = _policy_for(policy, False)
+
+    shared: Budget = Budget(policy)
+    token = _shared_budget.set(shared)
+    try:
+        yield shared
+    finally:
+        _shared_budget.reset(token)
@@ -0,0 +1,204 @@
+"""Unit tables for Angets."""
+
+# Built-ins
+from typing import TYPE_CHECKING, Iterable, Mapping, Optional
+from re import Pattern, compile
+
+# Angets
+from ._helpers import import_numpy, normalize_to_ascii
+from ._exceptions import InvalidBoundsError, InvalidUnitError, NonFloatingPointError
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+_QUANTITY: Pattern[str] = compile(
+    r"\s*([+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)\s*(\S*)\s*"
+)
+"""A number optionally followed by a unit suffix."""
+
+
+class UnitTable:
+    """Unit suffixes and their factors relative to a base unit.
+
+    | Suffixes are indexed once on creation, so lookups cost the same regardless of the size of the table.
+    | Symbols are case-sensitive, as 'Mb' and 'MB' or 'ms' and 'Ms' are different units.
+    | Words such as 'hours' are matched case-insensitively.
+    | Tables without ambiguous symbols may opt in to case-insensitive symbols with fold_case.
+    | >>> LENGTH = UnitTable("m", {"mm": 0.001, "cm": 0.01, "km": 1000}, {"metres": 1})
+    | >>> LENGTH.parse("2.5km")
+    | 2500.0
+    """
+
+    __slots__ = ("base", "factors", "words", "fold_case", "_symbols", "_index", "_words")
+
+    def __init__(
+        self,
+        base: str,
+        factors: Mapping[str, float],
+        words: Optional[Mapping[str, float]] = None,
+        fold_case: bool = False,
+    ) -> None:
+        """Create and return a new UnitTable object.
+
+        :param str base: The base unit. Bare numbers are read in the base unit unless told otherwise.
+        :param dict factors: Number of base units in one of each unit symbol.
+        :param dict words: Number of base units in one of each unit word, matched case-insensitively.
+        :param bool fold_case: Match symbols case-insensitively as well. Off by default.
+        """
+        self.base: str = base
+        self.words: dict[str, float] = dict(words or {})
+        self.factors: dict[str, float] = {base: 1.0, **factors, **self.words}
+        self.fold_case: bool = fold_case
+        self._symbols: dict[str, float] = dict(factors)
+        self._index: dict[str, float] = (
+            {suffix.lower(): factor for suffix, factor in self.factors.items()}
+            if fold_case
+            else {base: 1.0, **factors}
+        )
+        self._words: dict[str, float] = {
+            word.lower(): factor for word, factor in self.words.items()
+        }
+
+    def _lookup(self, unit: str) -> Optional[float]:
+        """Return the factor of a unit, or None if the unit is not in the table."""
+        factor: Optional[float] = self._index.get(
+            unit.lower() if self.fold_case else unit
+        )
+        if factor is None:
+            factor = self._words.get(unit.lower())
+
+        return factor
+
+    def __contains__(self, unit: str) -> bool:
+        return self._lookup(unit) is not None
+
+    def extend(
+        self,
+        factors: Mapping[str, float],
+        words: Optional[Mapping[str, float]] = None,
+    ) -> "UnitTable":
+        """Return a new unit table with the given symbols and words added."""
+        return UnitTable(
+            self.base,
+            {**self._symbols, **factors},
+            {**self.words, **(words or {})},
+            self.fold_case,
+        )
+
+    def factor(self, unit: str, warning: Optional[str] = None) -> float:
+        """Return the number of base units in one of the given unit.
+
+        :raise InvalidUnitError: If the unit is not in the table.
+        """
+        factor: Optional[float] = self._lookup(unit)
+        if factor is None:
+            raise InvalidUnitError(warning)
+
+        return factor
+
+    def parse(
+        self,
+        text: str,
+        default_unit: Optional[str] = None,
+        warning: Optional[str] = None,
+    ) -> float:
+        """Return a quantity such as '250ms' or '1.5 GiB' in base units.
+
+        :param str text: The quantity string. Full-width characters are normalized.
+        :param str default_unit: The unit for bare numbers. If None, the base unit will be used.
+        :param str warning: User defined warning string. If None, the default warning will be used.
+
+        :raise NonFloatingPointError: If the string does not start with a number.
+        :raise InvalidUnitError: If the unit is not in the table.
+        """
+        match = _QUANTITY.fullmatch(normalize_to_ascii(text))
+        if match is None:
+            raise NonFloatingPointError(warning)
+
+        number, unit = match.groups()
+        return float(number) * self.factor(unit or default_unit or self.base, warning)
+
+    def parse_many(
+        self, texts: Iterable[str], default_unit: Optional[str] = None
+    ) -> "NDArray":
+        """Return the quantities as a NumPy array of floats in base units.
+
+        | Requires NumPy.
+
+        :raise NonFloatingPointError: If any of the strings does not start with a number.
+        :raise InvalidUnitError: If any of the units is not in the table.
+        """
+        numpy = import_numpy()
+        return numpy.fromiter(
+            (self.parse(text, default_unit) for text in texts), dtype=numpy.float64
+        )
+
+    def bounds(self, within: tuple[float | str, float | str]) -> tuple[float, float]:
+        """Return (lower, upper) bounds in base units. Numbers are taken as base units already.
+
+        :raise InvalidBoundsError: If a bound cannot be read with the units.
+        """
+        try:
+            return (
+                self.parse(within[0]) if isinstance(within[0], str) else within[0],
+                self.parse(within[1]) if isinstance(within[1], str) else within[1],
+            )
+        except ValueError as error:
+            raise InvalidBoundsError(within) from error
+
+
+DURATION: UnitTable = UnitTable(
+    "s",
+    {
+        "ns": 1e-9,
+        "us": 1e-6,
+        "μs": 1e-6,
+        "ms": 1e-3,
+        "m": 60.0,
+        "h": 3600.0,
+        "d": 86400.0,
+        "w": 604800.0,
+    },
+    {
+        "sec": 1.0,
+        "secs": 1.0,
+        "second": 1.0,
+        "seconds": 1.0,
+        "min": 60.0,
+        "mins": 60.0,
+        "minute": 60.0,
+        "minutes": 60.0,
+        "hr": 3600.0,
+        "hrs": 3600.0,
+        "hour": 3600.0,
+        "hours": 3600.0,
+        "day": 86400.0,
+        "days": 86400.0,
+        "wk": 604800.0,
+        "week": 604800.0,
+        "weeks": 604800.0,
+    },
+)
+"""Durations in seconds."""
+
+SIZE: UnitTable = UnitTable(
+    "B",
+    {
+        "kB": 1e3,
+        "KB": 1e3,
+        "MB": 1e6,
+        "GB": 1e9,
+        "TB": 1e12,
+        "PB": 1e15,
+        "KiB": 2.0**10,
+        "MiB": 2.0**20,
+        "GiB": 2.0**30,
+        "TiB": 2.0**40,
+        "PiB": 2.0**50,
+    },
+    {
+        "byte": 1.0,
+        "bytes": 1.0,
+    },
+)
+"""Data sizes in bytes."""
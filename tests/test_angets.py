@@ -2,6 +2,7 @@
 
 # Built-ins
 from datetime import date
+from functools import cache, partial
 
 # Angets
 import angets
@@ -242,3 +243,368 @@ class TestConfirmation:
             selection={"k": True, "kay": True, "n": False, "nay": False}
         )
         assert result == True
+
+
+class TestRetryPolicy:
+    def test_exception0(self):
+        with pytest.raises(err.InvalidAttemptsValueError):
+            angets.policies.RetryPolicy(attempts=0)
+
+    def test_exception1(self):
+        with pytest.raises(err.InvalidAttemptsValueError):
+            angets.policies.RetryPolicy(attempts=3, limits={err.NonIntegerError: 0})
+
+    def test_exception2(self, monkeypatch):
+        inputs = iter(["1.5", "2.5", "3"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+        policy = angets.policies.RetryPolicy(
+            attempts=5, limits={err.NonIntegerError: 2}
+        )
+        with pytest.raises(err.AttemptsExceededError):
+            angets.get_int(policy=policy)
+
+    def test_exception3(self, monkeypatch):
+        inputs = iter(["0", "0", "0", "5"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+        with pytest.raises(err.AttemptsExceededError):
+            angets.get_positive_int(attempts=3)
+
+    def test_hash0(self):
+        limits = {err.NonIntegerError: 2}
+        policy = angets.policies.RetryPolicy(3, limits=limits)
+        assert hash(policy) == hash(angets.policies.RetryPolicy(3, limits=dict(limits)))
+        assert hash(angets.policies.RetryPolicy(3)) != hash(policy)
+
+    def test_returned_value0(self, monkeypatch):
+        inputs = iter(["1.5", "", "3"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+        policy = angets.policies.RetryPolicy(
+            attempts=5, limits={err.NonIntegerError: 3}
+        )
+        result = angets.get_int(policy=policy)
+        assert result == 3
+
+    def test_returned_value1(self, monkeypatch):
+        delays = []
+        inputs = iter(["x", "x", "x", "7"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+        monkeypatch.setattr("angets._policies.sleep", delays.append)
+        policy = angets.policies.RetryPolicy(
+            attempts=4, backoff=0.5, backoff_factor=2, max_backoff=1.5
+        )
+        result = angets.get_float(policy=policy)
+        assert result == 7.0
+        assert delays == [0.5, 1.0, 1.5]
+
+    def test_nested0(self, monkeypatch):
+        @angets.decorators.loop
+        def ask(**kwargs):
+            return angets.get_int(attempts=3), angets.get_int(attempts=3)
+
+        inputs = iter(["x", "x", "5", "7"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+        result = ask()
+        assert result == (5, 7)
+
+    def test_verbose0(self, monkeypatch, capsys):
+        inputs = iter(["Orgil", "3"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+        result = angets.get_positive_int(attempts=2, verbose=True, warning="Nope")
+        assert result == 3
+        assert capsys.readouterr().out == "Nope\n"
+
+
+class TestBudget:
+    def test_exception0(self, monkeypatch):
+        inputs = iter(["", "Bob", "x", "x", "4"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+        with angets.policies.budget(4):
+            assert angets.get_non_empty_str() == "Bob"
+            with pytest.raises(err.AttemptsExceededError):
+                angets.get_int()
+            with pytest.raises(err.AttemptsExceededError):
+                angets.get_int()
+        assert next(inputs) == "4"
+
+    def test_exception1(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "x")
+        with angets.policies.budget(1):
+            with pytest.raises(err.NonIntegerError):
+                angets.get_int()
+
+    def test_returned_value0(self, monkeypatch):
+        inputs = iter(["", "Bob", "x", "4"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+        with angets.policies.budget(4) as shared:
+            name = angets.get_non_empty_str(attempts=1)
+            age = angets.get_positive_int()
+        assert (name, age) == ("Bob", 4)
+        assert (shared.used, shared.failed) == (4, 2)
+
+
+class TestQuantity:
+    def test_exception0(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "30 fortnights")
+        with pytest.raises(err.InvalidUnitError):
+            angets.get_duration()
+
+    def test_exception1(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "GiB")
+        with pytest.raises(err.NonFloatingPointError):
+            angets.get_size()
+
+    def test_exception2(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "3h")
+        with pytest.raises(err.OutOfBoundsError):
+            angets.get_duration(within=("1m", "2h"), interval="[]")
+
+    def test_exception3(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "-5ms")
+        with pytest.raises(err.OutOfBoundsError):
+            angets.get_duration()
+
+    def test_exception4(self, monkeypatch):
+        inputs = iter(["1h"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+        with pytest.raises(err.InvalidBoundsError):
+            angets.get_duration(within=("1 lightyear", "2h"), attempts=3)
+        assert next(inputs) == "1h"
+
+    def test_exception5(self):
+        for text in ["1Mb", "8b"]:
+            with pytest.raises(err.InvalidUnitError):
+                angets.units.SIZE.parse(text)
+
+    def test_exception6(self):
+        for text in ["1Ms", "2 H"]:
+            with pytest.raises(err.InvalidUnitError):
+                angets.units.DURATION.parse(text)
+
+    def test_words0(self):
+        duration = angets.units.DURATION
+        assert [duration.parse(text) for text in ["2 Hours", "30 Min", "5 Sec"]] == [7200, 1800, 5]
+        assert angets.units.SIZE.parse("3 BYTES") == 3
+
+    def test_returned_value0(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "250ms")
+        result = angets.get_duration()
+        assert result == 0.25
+
+    def test_returned_value1(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "1.5 GiB")
+        result = angets.get_size()
+        assert result == 1.5 * 2**30
+
+    def test_returned_value2(self, monkeypatch):
+        inputs = iter(["30 fortnights", "３０ｍ"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+        result = angets.get_duration(within=("1m", "2h"), interval="[]", attempts=2)
+        assert result == 1800
+
+    def test_returned_value3(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "15")
+        result = angets.get_duration(default_unit="min")
+        assert result == 900
+
+    def test_returned_value4(self, monkeypatch):
+        length = angets.units.UnitTable("m", {"cm": 0.01, "km": 1000}, fold_case=True)
+        monkeypatch.setattr("builtins.input", lambda _: "2.5KM")
+        result = angets.get_quantity(length, within=(0, "10km"), interval="[]")
+        assert result == 2500
+
+    def test_extend0(self):
+        table = angets.units.DURATION.extend({}, {"fortnight": 1209600})
+        assert table.parse("2 Fortnight") == 2419200
+        assert table.parse("1Hour") == 3600
+        assert "fortnight" not in angets.units.DURATION
+
+    def test_parse_many0(self):
+        numpy = pytest.importorskip("numpy")
+        result = angets.units.SIZE.parse_many(["1KiB", "2 kB", "3"])
+        assert result.dtype == numpy.float64
+        assert result.tolist() == [1024, 2000, 3]
+
+
+class TestConfig:
+    schema = {
+        "PORT": angets.get_positive_int,
+        "RATIO": partial(angets.get_constrained_float, (0, 1), "[]"),
+        "START": angets.get_date,
+        "DEBUG": angets.get_confirmation,
+        "TIMEOUT": partial(angets.get_duration, within=("1s", "1m"), interval="[]"),
+    }
+
+    def test_exception0(self):
+        settings = angets.config.from_mapping({"PORT": "0"}, self.schema)
+        with pytest.raises(err.InvalidSettingError):
+            settings["PORT"]
+
+    def test_exception1(self):
+        settings = angets.config.from_mapping({}, self.schema)
+        with pytest.raises(KeyError):
+            settings["PORT"]
+
+    def test_exception2(self):
+        source = {"PORT": "x", "RATIO": "0.5", "START": "2024-02-22", "DEBUG": "y"}
+        with pytest.raises(err.InvalidConfigError) as info:
+            angets.config.from_mapping(source, self.schema, lazy=False)
+        assert [error.key for error in info.value.errors] == ["PORT", "TIMEOUT"]
+
+    def test_exception3(self):
+        with pytest.raises(err.InvalidIntervalError):
+            angets.config.from_mapping({}, {"X": partial(angets.get_constrained_int, (0, 1), "{}")})
+
+    def test_exception4(self):
+        @angets.decorators.loop
+        def get_name(prompt="", warning=None, **kwargs):
+            return input(prompt)
+
+        with pytest.raises(TypeError):
+            angets.config.from_mapping({}, {"NAME": get_name})
+
+    def test_cached0(self):
+        settings = angets.config.from_mapping({"X": "42"}, {"X": cache(int)})
+        assert settings["X"] == 42
+
+    def test_exception5(self):
+        rule = partial(angets.get_constrained_number, lambda prompt, warning: 0.5, (0, 1), "[]")
+        with pytest.raises(TypeError):
+            angets.config.from_mapping({}, {"X": rule})
+
+    def test_exception6(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            angets.config.from_file(tmp_path / "missing.ini", self.schema)
+
+    def test_constrained_number0(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: pytest.fail("Prompted for input."))
+        rule = partial(angets.get_constrained_number, angets.get_float, (0, 1), "[]")
+        settings = angets.config.from_mapping({"X": "9", "Y": "0.5"}, {"X": rule, "Y": rule})
+        with pytest.raises(err.InvalidSettingError):
+            settings["X"]
+        assert settings["Y"] == 0.5
+
+    def test_lazy0(self):
+        source = {"PORT": "８０８０", "RATIO": "1.5"}
+        settings = angets.config.from_mapping(source, self.schema)
+        assert settings["PORT"] == 8080
+        source["PORT"] = "9090"
+        assert settings["PORT"] == 8080
+
+    def test_returned_value0(self):
+        source = {"PORT": "8080", "RATIO": "0.5", "START": "2024-02-22", "DEBUG": "Y"}
+        settings = angets.config.from_mapping(
+            source, self.schema, defaults={"TIMEOUT": 30.0}, lazy=False
+        )
+        assert dict(settings) == {
+            "PORT": 8080,
+            "RATIO": 0.5,
+            "START": date(2024, 2, 22),
+            "DEBUG": True,
+            "TIMEOUT": 30.0,
+        }
+
+    def test_returned_value1(self):
+        settings = angets.config.from_mapping({"NAME": " Bob "}, {"NAME": str.strip})
+        assert settings["NAME"] == "Bob"
+
+    def test_from_file0(self, tmp_path):
+        path = tmp_path / "settings.toml"
+        path.write_text('debug = false\n[server]\nport = 8080\ntimeout = "250ms"\n')
+        settings = angets.config.from_file(
+            path,
+            {
+                "debug": angets.get_confirmation,
+                "server.port": angets.get_positive_int,
+                "server.timeout": angets.get_duration,
+            },
+        )
+        assert (settings["debug"], settings["server.port"], settings["server.timeout"]) == (False, 8080, 0.25)
+
+    def test_from_file1(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text('# Comment\nexport PORT=8080\nNAME="Bob"\n')
+        settings = angets.config.from_file(
+            path, {"PORT": angets.get_positive_int, "NAME": angets.get_non_empty_str}
+        )
+        assert (settings["PORT"], settings["NAME"]) == (8080, "Bob")
+
+    def test_from_file2(self, tmp_path):
+        path = tmp_path / "settings.ini"
+        path.write_text("[server]\nPort = 8080\n")
+        settings = angets.config.from_file(path, {"server.Port": angets.get_positive_int})
+        assert settings["server.Port"] == 8080
+
+
+class TestSelection:
+    def test_exception0(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "0-3")
+        with pytest.raises(err.OutOfBoundsError):
+            angets.get_selection(10)
+
+    def test_exception1(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "5-3")
+        with pytest.raises(err.InvalidSelectionError):
+            angets.get_selection(10)
+
+    def test_exception2(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "1,two")
+        with pytest.raises(err.NonIntegerError):
+            angets.get_selection(10)
+
+    def test_exception3(self, monkeypatch):
+        inputs = iter(["11", "!", "1-2-3"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+        with pytest.raises(err.AttemptsExceededError):
+            angets.get_selection(10, attempts=3)
+
+    def test_exception4(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: pytest.fail("Prompted for input."))
+        with pytest.raises(err.InvalidItemCountError):
+            angets.get_selection(-1, attempts=4)
+
+    def test_exception5(self):
+        with pytest.raises(err.InvalidItemCountError):
+            angets.config.from_mapping({}, {"X": partial(angets.get_selection, -1)})
+
+    def test_exception6(self):
+        for text in [",", "1,,2", "1,", "-", "! -", "1--3", "1-2-3"]:
+            with pytest.raises(err.InvalidSelectionError):
+                angets.parsers.parse_selection(text, 10)
+
+    def test_returned_value0(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "1-5,8,10-")
+        result = angets.get_selection(12)
+        assert result == 0b111010011111
+
+    def test_returned_value1(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "!2-3, !10")
+        result = angets.get_selection(10)
+        assert result == 0b0111111001
+
+    def test_returned_value2(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "ALL,!-3,!all,７")
+        result = angets.get_selection(8)
+        assert result == 0b01000000
+
+    def test_returned_value3(self, monkeypatch):
+        inputs = iter(["0", "2,4"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+        result = angets.get_selection(300, attempts=2)
+        assert result == 0b1010
+
+    def test_returned_value4(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda _: "none")
+        result = angets.get_selection(8)
+        assert result == 0
+
+    def test_as_array0(self, monkeypatch):
+        pytest.importorskip("numpy")
+        monkeypatch.setattr("builtins.input", lambda _: "1,3,9-")
+        result = angets.get_selection(10, as_array=True)
+        assert result.tolist() == [True, False, True] + [False] * 5 + [True, True]
+
+    def test_config0(self):
+        settings = angets.config.from_mapping(
+            {"SKIP": "2-3"}, {"SKIP": partial(angets.get_selection, 4)}
+        )
+        assert settings["SKIP"] == 0b0110